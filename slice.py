@@ -1,18 +1,174 @@
+import asyncio
 import os
 import re
+import shutil
 import subprocess
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import List, Tuple, Optional
 import threading
+import queue
 import tempfile
-import pygame
-import yt_dlp
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from io import BytesIO
-from PIL import Image, ImageTk
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3, APIC, TIT2, TALB, TPE1
+from PIL import Image, ImageTk, JpegImagePlugin
+from mutagen import File as MutagenFile
+from mutagen.id3 import ID3, ID3NoHeaderError, APIC, TIT2, TALB, TPE1, TXXX
+
+
+# Description parsing patterns, compiled once at import rather than on every call.
+
+# One pattern for a whole tracklist line, scanned over the full description with re.MULTILINE.
+# [^\S\n] is whitespace that can't run onto the next line. Alternatives are tried in order:
+#
+# Title before timestamp: track number (optional), Title, Timestamp, optional trailing ~
+#   Example: "１.愛のゆくえ 0:03〜", "1 - The Sea 00:00"
+# Timestamp before title: Timestamp, optional separators, Title
+#   Example: "00:00 - The Sea", "05:31 Natsuno Yoru no Machi"
+_TRACK_LINE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(?:[０-９]+\.?[^\S\n]*[-–—]?[^\S\n]*)?'  # Optional leading track number (half/full-width), period, space, hyphen
+    r'(?P<title>.+?)'                          # Non-greedy capture of the title
+    r'[^\S\n]*(?P<ts>\d{1,2}:\d{2}(?::\d{2})?)'  # Capture the timestamp
+    r'[^\S\n]*[-–—~〜]?[^\S\n]*'               # Optional separators and whitespace at end
+    r'|'
+    r'(?P<lead_ts>\d{1,2}:\d{2}(?::\d{2})?)'     # Capture the timestamp
+    r'[^\S\n]*[-–—~〜]?[^\S\n]*'               # Optional separators and whitespace
+    r'(?P<lead_title>.+)'                      # Capture the rest of the line as title
+    r')$'
+    , re.UNICODE | re.MULTILINE
+)
+
+# Header/footer lines of a tracklist that look like tracks but aren't
+_SKIP_LINE = re.compile(r'track ?list|playlist|setlist', re.IGNORECASE)
+
+# Any text within parentheses or square brackets (e.g., [Official Video], (Live))
+_CLEAN_BRACKETS = re.compile(r'[\[\(].*?[\]\)]')
+
+# Leading noise: hyphens, spaces, periods, digits (half-width and full-width Japanese),
+# and various bracket/quote characters at the beginning of the title; plus any trailing tildes.
+_CLEAN_EDGES = re.compile(r'^[-\s\.\d０-９\[\]\(\)「」『』"\'~〜]+|[~〜]+$', re.UNICODE)
+
+# Every ffmpeg run starts like this: stderr then only carries actual errors, which is all that gets reported,
+# and ffmpeg doesn't watch the inherited stdin for keyboard commands
+_FFMPEG = ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostats', '-nostdin']
+
+# Description of the ID3 TXXX frame in which every cut records what it was cut from (see _cut_source)
+_SOURCE_TAG = 'yt-mp3-slicer source'
+
+# Characters that aren't allowed in file names on Windows; str.translate drops them in one pass
+_FORBIDDEN_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+
+@lru_cache(maxsize=None)
+def _http():
+    """One HTTP session for the whole app, so repeated thumbnail fetches reuse the connection"""
+    # requests is imported on first use (always from a worker thread) rather than before the window shows
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> int:
+    """Convert timestamp string to seconds (cached: the same strings are parsed over and over)"""
+    # Slice around the colons directly instead of split() + map(int, ...), and check the
+    # fields are plain digits up front instead of catching int()'s ValueError.
+    # Accepted: mm:ss or hh:mm:ss, surrounding whitespace stripped, every field one or more decimal
+    # digits (str.isdecimal, so full-width digits too). int() alone would also take a sign ('+1:30',
+    # '1:-30'), underscores ('1_0:30') or whitespace next to a colon ('1: 30'); those are rejected.
+    ts = timestamp.strip()
+    first = ts.find(':')
+    second = ts.find(':', first + 1) if first != -1 else -1
+    if second == -1:  # mm:ss
+        minutes, secs = ts[:first], ts[first + 1:]
+        if first != -1 and minutes.isdecimal() and secs.isdecimal():
+            return int(minutes) * 60 + int(secs)
+    else:  # hh:mm:ss (a third colon leaves one in secs, which fails the check)
+        hours, minutes, secs = ts[:first], ts[first + 1:second], ts[second + 1:]
+        if hours.isdecimal() and minutes.isdecimal() and secs.isdecimal():
+            return int(hours) * 3600 + int(minutes) * 60 + int(secs)
+    raise ValueError(f"Invalid timestamp format: {timestamp}")
+
+
+@lru_cache(maxsize=4096)
+def _seconds_to_timestamp(seconds: int) -> str:
+    """Convert seconds to mm:ss or hh:mm:ss format"""
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _clean_title(title: str) -> str:
+    """Strip tracklist noise from a track title; empty if nothing usable is left"""
+    # Remove any text within parentheses or square brackets (e.g., [Official Video], (Live))
+    title = _CLEAN_BRACKETS.sub('', title).strip()
+    # Remove leading/trailing quotes (single, double, Japanese)
+    title = title.strip('「」『』""\'\'')
+    # Remove leading noise (numbers, punctuation, spaces, etc.) and any trailing tilde in one pass
+    title = _CLEAN_EDGES.sub('', title).strip()
+    return '' if title.isdigit() else title # Just a number isn't a title
+
+
+def _image_mime(data: bytes) -> str:
+    """MIME type of cover art from its magic bytes (crops are JPEG, but YouTube also serves WebP)"""
+    if data.startswith(b'\x89PNG'):
+        return 'image/png'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
+
+@lru_cache(maxsize=1)
+def _album_frames(thumbnail_data: bytes) -> Tuple[APIC, TALB]:
+    """ID3 frames shared by every track of the album, built once per thumbnail rather than once per file"""
+    return (
+        APIC(
+            encoding=3,  # UTF-8
+            mime=_image_mime(thumbnail_data),
+            type=3,      # Cover image
+            desc='Cover',
+            data=thumbnail_data  # This will be the cropped version if user selected one
+        ),
+        TALB(encoding=3, text="YouTube Album"),  # Album
+    )
+
+
+@lru_cache(maxsize=4)
+def _decode_image(data: bytes) -> Image.Image:
+    """Decoded thumbnail for some image bytes, decoded once; callers must copy() before changing it"""
+    image = Image.open(BytesIO(data))
+    image.load() # Decode now rather than lazily on first use
+    return image
+
+
+def _encode_cover(image: Image.Image, source: Image.Image) -> bytes:
+    """JPEG bytes for a crop of source, for use as cover art"""
+    options = {'quality': 90, 'optimize': False} # No extra Huffman-optimisation pass
+    # A crop of a JPEG keeps the source's chroma subsampling instead of Pillow's default
+    if source.format == 'JPEG' and JpegImagePlugin.get_sampling(source) != -1:
+        options['subsampling'] = JpegImagePlugin.get_sampling(source)
+    if image.mode not in ('RGB', 'L'): # e.g. PNG/WebP with alpha, which JPEG can't store
+        image = image.convert('RGB')
+    byte_arr = BytesIO()
+    image.save(byte_arr, format='JPEG', **options)
+    return byte_arr.getvalue()
+
+
+def _resize_square_side(anchor_x, anchor_y, sign_x, sign_y, x, y, img_x1, img_y1, img_x2, img_y2, min_size):
+    """Side of the square crop box dragged from the anchor corner towards (x, y), kept inside the image"""
+    # Room between the anchor and the image edge on the side being dragged towards
+    room_x = img_x2 - anchor_x if sign_x > 0 else anchor_x - img_x1
+    room_y = img_y2 - anchor_y if sign_y > 0 else anchor_y - img_y1
+    # The pointer decides the size, the shorter of its two distances keeps it square,
+    # the room to the edges keeps it inside the image and min_size keeps it grabbable
+    return max(min_size, min(sign_x * (x - anchor_x), sign_y * (y - anchor_y), room_x, room_y))
 
 
 class Track:
@@ -22,6 +178,17 @@ class Track:
         self.end_time = end_time
         self.artist = artist.strip() if artist else ""
     
+    @property
+    def start_sec(self) -> int:
+        """Start time in seconds"""
+        # Not stored: edit_track rewrites start_time/end_time in place, and the parse itself is cached
+        return _parse_timestamp(self.start_time)
+
+    @property
+    def end_sec(self) -> Optional[int]:
+        """End time in seconds, or None if the track runs to the end of the audio"""
+        return _parse_timestamp(self.end_time) if self.end_time else None
+
     def __str__(self):
         end = f" - {self.end_time}" if self.end_time else ""
         artist_str = f" by {self.artist}" if self.artist else ""
@@ -31,131 +198,115 @@ class YouTubeAlbumSplitter:
     def __init__(self, root_gui): # Pass root_gui to access its attributes
         self.video_info = None
         self.audio_file = None
+        self.downloaded_url = None # URL that audio_file/video_info belong to, for reuse on re-analysis
+        self.download_dir = None # Private temp dir the current download lives in
+        self._duration_cache = {} # (path, mtime, size) -> duration reported by ffprobe
+        self._codec_cache = {} # (path, mtime, size) -> audio codec reported by ffprobe
         self.tracks = []
         self.root_gui = root_gui # Store reference to the GUI instance
     
     def parse_timestamp(self, timestamp: str) -> int:
         """Convert timestamp string to seconds"""
-        try:
-            parts = timestamp.strip().split(':')
-            if len(parts) == 2:  # mm:ss
-                minutes, seconds = map(int, parts)
-                return minutes * 60 + seconds
-            elif len(parts) == 3:  # hh:mm:ss
-                hours, minutes, seconds = map(int, parts)
-                return hours * 3600 + minutes * 60 + seconds
-            else:
-                raise ValueError("Invalid timestamp format")
-        except ValueError:
-            raise ValueError(f"Invalid timestamp format: {timestamp}")
+        return _parse_timestamp(timestamp)
     
     def seconds_to_timestamp(self, seconds: int) -> str:
         """Convert seconds to mm:ss or hh:mm:ss format"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return _seconds_to_timestamp(seconds)
     
+    def extract_tracks(self, video_info: dict) -> List[Track]:
+        """
+        Get the tracklist for a video.
+        Uses the chapters yt-dlp already extracted when there are any, and only falls back
+        to parsing timestamps out of the description when there aren't.
+        """
+        chapters = video_info.get('chapters')
+        if not chapters:
+            return self.extract_timestamps_from_description(video_info.get('description', ''))
+
+        tracks = []
+        for chapter in chapters:
+            # Chapters yt-dlp read from the description keep track numbers and [Official Video]-style noise
+            title = _clean_title(chapter.get('title') or '')
+            if not title: # Nothing to name the file after, so leave this chapter out
+                continue
+            tracks.append(Track(title, self.seconds_to_timestamp(int(chapter['start_time'])),
+                                self.seconds_to_timestamp(int(chapter['end_time']))))
+        if not tracks:
+            return self.extract_timestamps_from_description(video_info.get('description', ''))
+
+        # Like parsed tracklists, the last track runs until the end of the audio
+        # (unless the last chapter was left out, in which case the track before it keeps its end)
+        if tracks[-1].end_sec == int(chapters[-1]['end_time']):
+            tracks[-1].end_time = None
+        return tracks
+
     def extract_timestamps_from_description(self, description: str) -> List[Track]:
         """
         Extract track information from video description.
         Improved logic to handle various formats including timestamp before or after title,
         and Japanese characters/symbols.
         """
-        tracks = []
-        
-        # Define patterns for different common formats
-        # Pattern 1: Track number (optional), Title, Timestamp, optional trailing ~
-        # Example: "１.愛のゆくえ 0:03〜", "1 - The Sea 00:00"
-        # Group 1: Title, Group 2: Timestamp
-        pattern_title_before_ts = re.compile(
-            r'^(?:[０-９]+\.?\s*[-–—]?\s*)?'  # Optional leading track number (half/full-width), period, space, hyphen
-            r'(.+?)'                          # Non-greedy capture of the title
-            r'\s*(\d{1,2}:\d{2}(?::\d{2})?)'  # Capture the timestamp
-            r'\s*[-–—~〜]?\s*$'               # Optional separators and whitespace at end
-            , re.UNICODE
-        )
-
-        # Pattern 2: Timestamp, optional separators, Title
-        # Example: "00:00 - The Sea", "05:31 Natsuno Yoru no Machi"
-        # Group 1: Timestamp, Group 2: Title
-        pattern_ts_before_title = re.compile(
-            r'(\d{1,2}:\d{2}(?::\d{2})?)'  # Capture the timestamp
-            r'\s*[-–—~〜]?\s*'             # Optional separators and whitespace
-            r'(.+)'                        # Capture the rest of the line as title
-            , re.UNICODE
-        )
+        parsed = [] # (start seconds, Track) pairs, so each timestamp is parsed exactly once
+        seen = set() # (title, start_time) of every track in parsed, for O(1) duplicate checks
         
-        lines = description.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
+        for match in _TRACK_LINE.finditer(description):
             # Skip lines that are likely headers or footers for tracklists
-            if any(skip_word in line.lower() for skip_word in ['tracklist', 'track list', 'playlist', 'setlist']):
+            if _SKIP_LINE.search(match.group(0)):
                 continue
             
-            title = None
-            start_time = None
-
-            # Try Pattern 1 (Title before Timestamp) first
-            match = pattern_title_before_ts.match(line)
-            if match:
-                title = match.group(1).strip()
-                start_time = match.group(2)
+            if match.group('ts'):
+                title = match.group('title').strip()
+                start_time = match.group('ts')
             else:
-                # If Pattern 1 doesn't match, try Pattern 2 (Timestamp before Title)
-                match = pattern_ts_before_title.match(line)
-                if match:
-                    start_time = match.group(1)
-                    title = match.group(2).strip()
+                start_time = match.group('lead_ts')
+                title = match.group('lead_title').strip()
 
             if title and start_time:
                 # Apply general cleanup to the extracted title
-                # Remove any text within parentheses or square brackets (e.g., [Official Video], (Live))
-                title = re.sub(r'[\[\(].*?[\]\)]', '', title).strip() 
-                # Remove leading/trailing quotes (single, double, Japanese)
-                title = title.strip('「」『』""\'\'') 
-                # Remove any trailing tilde or similar symbols
-                title = title.rstrip('~〜')
-                # NEW: More comprehensive cleanup for leading noise (numbers, punctuation, spaces, etc.)
-                # This regex matches one or more occurrences of common leading junk characters
-                # including hyphens, spaces, periods, digits (half-width and full-width Japanese),
-                # and various bracket/quote characters at the beginning of the string.
-                title = re.sub(r'^[-\s\.\d０-９\[\]\(\)「」『』"\'~〜]+', '', title, flags=re.UNICODE).strip()
-
-                if not title or title.isdigit(): # Skip if title is empty or just numbers
+                title = _clean_title(title)
+                if not title: # Skip if title is empty or just numbers
                     continue
                 
-                try:
-                    self.parse_timestamp(start_time) # Validate timestamp
-                    
-                    # Check for duplicates before adding to avoid redundant tracks
-                    if not any(t.title == title and t.start_time == start_time for t in tracks):
-                        tracks.append(Track(title, start_time)) # End time will be set in post-processing
-                except ValueError:
-                    # If timestamp is invalid, skip this line
-                    continue
-        
-        # Sort tracks by their start time to ensure correct ordering
-        tracks.sort(key=lambda t: self.parse_timestamp(t.start_time))
-        
-        # Assign end times based on the start time of the next track
-        for i in range(len(tracks)):
-            if i < len(tracks) - 1:
-                tracks[i].end_time = tracks[i + 1].start_time
-            # The last track's end_time remains None, which is handled by split_audio to go until the end of the audio.
+                # Check for duplicates before adding to avoid redundant tracks.
+                # No validation needed: anything _TRACK_LINE captures as a timestamp parses.
+                if (title, start_time) not in seen:
+                    seen.add((title, start_time))
+                    seconds = self.parse_timestamp(start_time)
+                    parsed.append((seconds, Track(title, start_time))) # End time will be set in post-processing
+        
+        # Sort tracks by their already-parsed start time to ensure correct ordering
+        parsed.sort(key=lambda pair: pair[0])
+        tracks = [track for _, track in parsed]
+        
+        # Assign end times based on the start time of the next track (no parsing: end_sec reads through the cache)
+        for track, next_track in zip(tracks, tracks[1:]):
+            track.end_time = next_track.start_time
+        # The last track's end_time remains None, which is handled by split_audio to go until the end of the audio.
         
         return tracks
     
-    def download_audio(self, url: str, progress_callback=None) -> str:
-        """Download audio from YouTube video"""
+    def download_audio(self, url: str, progress_callback=None, info_callback=None) -> str:
+        """
+        Download audio from YouTube video.
+        info_callback, if given, is called with the video info as soon as it has been
+        extracted, so the caller can work with the metadata while the audio downloads.
+        """
+        # yt-dlp takes a good while to import, so that waits until the first download rather than app start
+        import yt_dlp
+
+        # Analysing the same video again reuses the audio that is still on disk
+        if url == self.downloaded_url and self.audio_file and os.path.exists(self.audio_file):
+            if info_callback:
+                info_callback(self.video_info)
+            return self.audio_file
+        
+        # A different video: drop the previous download. Nothing playable until this one finishes.
+        self.cleanup()
+        self.audio_file = None
+        self.downloaded_url = None
+        # Each download gets its own directory, so two running instances can't pick up each other's file
+        self.download_dir = tempfile.mkdtemp(prefix='yt_mp3_slicer_')
+        
         def progress_hook(d):
             if progress_callback and d['status'] == 'downloading':
                 if 'downloaded_bytes' in d and 'total_bytes' in d:
@@ -163,18 +314,20 @@ class YouTubeAlbumSplitter:
                     progress_callback(f"Downloading: {percent:.1f}%")
         
         ydl_opts = {
-            'format': 'bestaudio/best',
-            'extractaudio': True,
-            'audioformat': 'mp3',
-            'outtmpl': 'temp_audio.%(ext)s',
+            'format': 'bestaudio/best', # Audio-only stream; 'best' is only the fallback for sites without one
+            'outtmpl': os.path.join(self.download_dir, 'temp_audio.%(ext)s'),
             'quiet': True,
+            'noplaylist': True, # A watch URL with &list= should fetch just this video
             'nooverwrites': True,
             'continuedl': True,
             'retries': 10,
-            'fragment-retries': 10,
-            'skip-unavailable-fragments': True,
-            'extractor-args': 'youtube:player_client=android',
-            'http-chunk-size': '1M',
+            # The Python API takes underscore keys; the command-line style hyphenated ones are silently ignored
+            'fragment_retries': 10,
+            'skip_unavailable_fragments': True,
+            'extractor_args': {'youtube': {'player_client': ['android']}},
+            'http_chunk_size': 1024 * 1024,
+            'concurrent_fragment_downloads': 4, # DASH/HLS formats come in fragments; fetch a few at once
+            'buffersize': 64 * 1024, # Read/write in 64 KiB blocks rather than yt-dlp's 1 KiB starting size
             'progress_hooks': [progress_hook] if progress_callback else [],
         }
         
@@ -185,130 +338,345 @@ class YouTubeAlbumSplitter:
                 except Exception as e:
                     raise Exception(f"Error getting video info: {e}")
                 
+                if info_callback:
+                    info_callback(self.video_info)
+                
                 try:
-                    ydl.download([url])
+                    # Download from the info we already have; download([url]) would extract it all over again
+                    downloaded = ydl.process_ie_result(self.video_info, download=True)
+                    filename = ydl.prepare_filename(downloaded)
                 except yt_dlp.utils.DownloadError:
-                    ydl_opts['extractor-args'] = 'youtube:player_client=web'
+                    # The formats extracted for the android client are no good, so extract afresh as web
+                    ydl_opts['extractor_args'] = {'youtube': {'player_client': ['web']}}
                     with yt_dlp.YoutubeDL(ydl_opts) as ydl_retry:
-                        ydl_retry.download([url])
+                        downloaded = ydl_retry.extract_info(url, download=True)
+                        filename = ydl_retry.prepare_filename(downloaded)
+                    # Duration, thumbnail and chapters now have to come from the info that produced the file
+                    self.video_info = downloaded
+
+                # Ask yt-dlp where it wrote the file instead of scanning the working directory.
+                # The audio is kept in its source codec; split_audio encodes to MP3 in a single pass.
+                self.audio_file = filename
             
-            for file in os.listdir('.'):
-                if file.startswith('temp_audio'):
-                    self.audio_file = file
-                    break
-            
-            if not self.audio_file:
+            if not self.audio_file or not os.path.exists(self.audio_file):
                 raise Exception("Failed to download audio file")
             
+            self.downloaded_url = url
             return self.audio_file
         except Exception as e:
             raise Exception(f"Failed to download audio: {e}")
         
     def split_audio(self, tracks: List[Track], output_dir: str = "output", cropped_thumbnail_data: bytes = None, progress_callback=None):
         """Split audio file into individual tracks with thumbnails"""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
         # Use the provided cropped_thumbnail_data or download original if not provided
         final_thumbnail_data = cropped_thumbnail_data
         if not final_thumbnail_data and self.video_info and 'thumbnail' in self.video_info:
             try:
-                response = requests.get(self.video_info['thumbnail'])
-                final_thumbnail_data = response.content
+                response = _http().get(self.video_info['thumbnail'], stream=True, timeout=10)
+                response.raise_for_status()
+                response.raw.decode_content = True # Undo any Content-Encoding, as .content would
+                buffer = BytesIO()
+                shutil.copyfileobj(response.raw, buffer, 64 * 1024)
+                final_thumbnail_data = buffer.getvalue()
             except Exception as e:
                 print(f"Couldn't download original thumbnail: {e}")
 
-        for i, track in enumerate(tracks, 1):
-            if progress_callback:
-                progress_callback(f"Processing track {i}/{len(tracks)}: {track.title}")
+        # Resolve every output path up front: (output_file, track) pairs in track order
+        jobs = [(self._output_path(output_dir, i, track), track) for i, track in enumerate(tracks, 1)]
+
+        # Tracks already cut by an earlier run only need their tags refreshed
+        pending = []
+        for output_file, track in jobs:
+            if not self._output_is_current(output_file, track):
+                pending.append((output_file, track))
+            elif final_thumbnail_data:
+                self.add_mp3_metadata(output_file, track.title, track.artist, final_thumbnail_data, self._cut_source(track))
+        if not pending:
+            return
+        jobs = pending
+
+        self._prefetch_source()
+
+        # A gapless tracklist (the usual case for description timestamps) from an MP3 source can be
+        # cut by a single stream-copy ffmpeg run. Anything else needs an encode, which is faster
+        # spread over one ffmpeg per track.
+        # A lone open-ended track from 0:00 gives the segment muxer no cut point, and without
+        # -segment_times it falls back to 2-second pieces, so that one goes the per-track way.
+        first = jobs[0][1]
+        has_cut_point = len(jobs) > 1 or first.start_sec > 0 or bool(first.end_time)
+        if self._source_is_mp3() and has_cut_point and self._tracks_are_contiguous([track for _, track in jobs]):
+            self._split_segments(jobs, output_dir, final_thumbnail_data, progress_callback)
+            return
 
-            start_seconds = self.parse_timestamp(track.start_time)
-            
-            safe_title = re.sub(r'[<>:"/\\|?*]', '', track.title)
-            safe_title = safe_title[:100]
-            output_file = os.path.join(output_dir, f"{i:02d}. {safe_title}.mp3")
-
-            # Split audio (same as before)
-            cmd = [
-                'ffmpeg', '-i', self.audio_file,
-                '-ss', str(start_seconds),
-                '-y'
-            ]
-            
-            if track.end_time:
-                end_seconds = self.parse_timestamp(track.end_time)
-                duration = end_seconds - start_seconds
-                cmd.extend(['-t', str(duration)])
-            
+        # Each track is an independent ffmpeg process, so launch them side by side from one event loop
+        asyncio.run(self._split_async(jobs, final_thumbnail_data, progress_callback))
+
+    def _source_is_mp3(self) -> bool:
+        """True if the downloaded audio is already MP3 and can be stream-copied"""
+        # Ask ffprobe rather than trusting the extension yt-dlp picked for the container
+        try:
+            return self._probe_codec(self.audio_file) == 'mp3'
+        except Exception:
+            return False # Can't tell, so take the re-encode path that always works
+
+    def _prefetch_source(self):
+        """Ask the kernel to start reading the downloaded audio into the page cache"""
+        # Advice is per open file, so POSIX_FADV_SEQUENTIAL here would never reach ffmpeg's own opens.
+        # WILLNEED starts readahead into the shared page cache, which every ffmpeg then reads from.
+        if not hasattr(os, 'posix_fadvise'): # Not available on Windows/macOS
+            return
+        try:
+            fd = os.open(self.audio_file, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass # Only a hint
+
+    def get_audio_duration(self) -> int:
+        """Length of the downloaded audio in seconds"""
+        if self.video_info and self.video_info.get('duration'):
+            return int(self.video_info['duration'])
+        return int(MutagenFile(self.audio_file).info.length)
+
+    def _output_path(self, output_dir: str, index: int, track: Track) -> str:
+        """Build the numbered, filesystem-safe output path for a track"""
+        safe_title = track.title.translate(_FORBIDDEN_FILENAME_CHARS)[:100]
+        return os.path.join(output_dir, f"{index:02d}. {safe_title}.mp3")
+
+    def _cut_source(self, track: Track) -> str:
+        """What a track's output is cut from: the downloaded audio file and the track's start and end"""
+        end = track.end_sec if track.end_time else 'end' # Open-ended tracks run to the end of that same file
+        return f"{self.audio_file}|{track.start_sec}|{end}"
+
+    def _output_is_current(self, output_file: str, track: Track) -> bool:
+        """True if output_file was cut by an earlier run from the same audio, start and end"""
+        if not os.path.exists(output_file):
+            return False
+        try:
+            # A matching name and length aren't enough: moving a start time or splitting another video
+            # with the same titles into this folder can give both. Files without the record are cut again.
+            frame = ID3(output_file).get(f'TXXX:{_SOURCE_TAG}')
+            if frame is None or frame.text != [self._cut_source(track)]:
+                return False
+            end_seconds = track.end_sec if track.end_time else self.get_audio_duration()
+            return abs(self._probe_duration(output_file) - (end_seconds - track.start_sec)) < 0.5
+        except Exception:
+            return False # Can't tell, so cut it again
+
+    def _probe_duration(self, filepath: str) -> float:
+        """Duration of a media file in seconds according to ffprobe, cached per file version"""
+        stat = os.stat(filepath)
+        key = (filepath, stat.st_mtime_ns, stat.st_size)
+        if key not in self._duration_cache:
+            result = subprocess.run(
+                ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', filepath],
+                check=True, capture_output=True, text=True
+            )
+            self._duration_cache[key] = float(result.stdout.strip())
+        return self._duration_cache[key]
+
+    def _probe_codec(self, filepath: str) -> str:
+        """Codec of the first audio stream according to ffprobe, cached per file version"""
+        stat = os.stat(filepath)
+        key = (filepath, stat.st_mtime_ns, stat.st_size)
+        if key not in self._codec_cache:
+            result = subprocess.run(
+                ['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-show_entries', 'stream=codec_name', '-of', 'csv=p=0', filepath],
+                check=True, capture_output=True, text=True
+            )
+            self._codec_cache[key] = result.stdout.strip()
+        return self._codec_cache[key]
+
+    def _tracks_are_contiguous(self, tracks: List[Track]) -> bool:
+        """True if every track ends exactly where the next one starts"""
+        for track, next_track in zip(tracks, tracks[1:]):
+            if not track.end_time:
+                return False
+            if track.end_sec <= track.start_sec or track.end_sec != next_track.start_sec:
+                return False
+        return True
+
+    def _split_segments(self, jobs: List[Tuple[str, Track]], output_dir: str, thumbnail_data: bytes = None, progress_callback=None):
+        """Cut a contiguous tracklist of (output_file, track) pairs in one ffmpeg pass using the segment muxer"""
+        tracks = [track for _, track in jobs]
+        # Cut at every track start; a lead-in before the first track and a tail after
+        # an explicit last end time become extra segments that are thrown away.
+        first_start = tracks[0].start_sec
+        cut_points = [t.start_sec for t in tracks[1:]]
+        lead_in = 1 if first_start > 0 else 0
+        if lead_in:
+            cut_points.insert(0, first_start)
+        if tracks[-1].end_time:
+            cut_points.append(tracks[-1].end_sec)
+
+        if progress_callback:
+            progress_callback(f"Splitting {len(tracks)} tracks...")
+
+        # Segments go to a scratch dir inside output_dir so the renames below stay on one filesystem
+        segment_dir = tempfile.mkdtemp(prefix='.segments_', dir=output_dir)
+        try:
+            # Only the audio stream: a cover-art/video stream would otherwise end up in every segment
+            cmd = [*_FFMPEG, '-i', self.audio_file, '-map', '0:a', '-f', 'segment']
+            # split_audio only comes here with at least one cut point (see there)
+            cmd.extend(['-segment_times', ','.join(map(str, cut_points))])
             cmd.extend([
-                '-acodec', 'mp3',
-                '-ab', '192k',
-                output_file
+                '-reset_timestamps', '1',
+                '-c', 'copy',
+                '-map_metadata', '-1', # The tracks get their own tags; don't carry over the whole video's
+                '-y', os.path.join(segment_dir, '%03d.mp3')
             ])
-            
+
             try:
-                # Removed creationflags=subprocess.CREATE_NO_WINDOW
-                subprocess.run(cmd, check=True, capture_output=True) 
-                
-                # Add metadata and thumbnail
-                if final_thumbnail_data:
-                    # Pass the track.artist to add_mp3_metadata
-                    self.add_mp3_metadata(output_file, track.title, track.artist, final_thumbnail_data)
-                    
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             except subprocess.CalledProcessError as e:
-                raise Exception(f"Failed to create {track.title}: {e.stderr.decode()}")
+                raise Exception(f"Failed to split tracks: {e.stderr.decode()}")
+
+            for i, (output_file, track) in enumerate(jobs):
+                segment_file = os.path.join(segment_dir, f"{i + lead_in:03d}.mp3")
+                # The segment muxer writes nothing for a cut point past the end of the audio
+                if not os.path.exists(segment_file):
+                    raise Exception(f"Failed to create {track.title}: it starts at {track.start_time}, "
+                                    f"which is past the end of the audio")
+                os.replace(segment_file, output_file)
+        finally:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+        def tag(job: Tuple[str, Track]) -> str:
+            output_file, track = job
+            if thumbnail_data:
+                self.add_mp3_metadata(output_file, track.title, track.artist, thumbnail_data, self._cut_source(track))
+            return track.title
+
+        # Adding the cover usually outgrows the ID3 padding, so mutagen rewrites each whole file.
+        # That's file I/O, which releases the GIL, so tag the tracks side by side.
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            for i, title in enumerate(pool.map(tag, jobs), 1):
+                if progress_callback:
+                    progress_callback(f"Processed track {i}/{len(tracks)}: {title}")
+
+    async def _split_async(self, jobs: List[Tuple[str, Track]], thumbnail_data: bytes = None, progress_callback=None):
+        """Run one ffmpeg job per CPU concurrently, each cutting a batch of (output_file, track) pairs"""
+        workers = min(len(jobs), os.cpu_count() or 1)
+        batches = [jobs[i::workers] for i in range(workers)]
+
+        # Let every batch finish and report all failures together, rather than
+        # abandoning the tracks that would have succeeded after the first error.
+        done = 0
+        failures = []
+        for batch_job in asyncio.as_completed([self._split_batch(batch, thumbnail_data) for batch in batches]):
+            try:
+                titles = await batch_job
+            except Exception as e:
+                failures.append(str(e))
+                continue
+            for title in titles:
+                done += 1
+                if progress_callback:
+                    progress_callback(f"Processed track {done}/{len(jobs)}: {title}")
+
+        if failures:
+            raise Exception("\n\n".join(failures))
+
+    async def _split_batch(self, batch: List[Tuple[str, Track]], thumbnail_data: bytes = None) -> List[str]:
+        """Cut a batch of (output_file, track) pairs with a single ffmpeg process and tag them"""
+        if self._source_is_mp3():
+            # Already MP3, so copy the frames instead of re-encoding them
+            codec_args = ['-c', 'copy']
+        else:
+            codec_args = ['-acodec', 'mp3', '-ab', '192k']
+        # The tracks get their own tags; don't carry over the whole video's
+        codec_args.extend(['-map_metadata', '-1'])
+
+        # Every track gets its own input with its own -ss/-t, so each one still seeks straight
+        # to its start (-ss before -i), but ffmpeg only starts up once for the whole batch.
+        cmd = [*_FFMPEG, '-y']
+        outputs = []
+        for input_index, (output_file, track) in enumerate(batch):
+            cmd.extend(['-ss', str(track.start_sec)])
+
+            if track.end_time:
+                duration = track.end_sec - track.start_sec
+                cmd.extend(['-t', str(duration)])
+
+            cmd.extend(['-i', self.audio_file])
+
+            outputs.extend(['-map', f'{input_index}:a', *codec_args, output_file])
+        cmd.extend(outputs)
+
+        process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+        try:
+            _, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # The split was abandoned; don't leave this ffmpeg running on its own
+            process.kill()
+            raise
+
+        titles = [track.title for _, track in batch]
+        if process.returncode != 0:
+            raise Exception(f"Failed to create {', '.join(titles)}: {stderr.decode()}")
+
+        # Add metadata and thumbnail
+        if thumbnail_data:
+            for output_file, track in batch:
+                # Pass the track.artist to add_mp3_metadata
+                self.add_mp3_metadata(output_file, track.title, track.artist, thumbnail_data, self._cut_source(track))
+
+        return titles
     
-    def add_mp3_metadata(self, filepath: str, title: str, artist: str, thumbnail_data: bytes):
+    def add_mp3_metadata(self, filepath: str, title: str, artist: str, thumbnail_data: bytes, source: str = None):
         """Add ID3 tags and thumbnail to MP3 file with optional cropping"""
         try:
-            audio = MP3(filepath, ID3=ID3)
-            
-            # Add ID3 tag if it doesn't exist
+            # Open just the ID3 tag: MP3() would also walk the MPEG frames to work out a duration we don't use
             try:
-                audio.add_tags()
-            except:
-                pass
+                tags = ID3(filepath)
+            except ID3NoHeaderError: # Fresh ffmpeg output may have no tag yet
+                tags = ID3()
             
-            # Add thumbnail (album art)
-            audio.tags.add(APIC(
-                encoding=3,  # UTF-8
-                mime='image/jpeg', # Assuming JPEG for thumbnails
-                type=3,      # Cover image
-                desc='Cover',
-                data=thumbnail_data  # This will be the cropped version if user selected one
-            ))
+            # Add thumbnail (album art) and album name; each save serialises them, so the frames can be shared
+            for frame in _album_frames(thumbnail_data):
+                tags.add(frame)
             
-            # Add basic metadata
-            audio.tags.add(TIT2(encoding=3, text=title))  # Title
-            audio.tags.add(TALB(encoding=3, text="YouTube Album"))  # Album
-            audio.tags.add(TPE1(encoding=3, text=artist))  # Artist (using the provided artist)
+            # Add per-track metadata
+            tags.add(TIT2(encoding=3, text=title))  # Title
+            tags.add(TPE1(encoding=3, text=artist))  # Artist (using the provided artist)
+            if source: # What the audio was cut from, so a later split can tell whether it is still current
+                tags.add(TXXX(encoding=3, desc=_SOURCE_TAG, text=source))
             
-            audio.save()
+            tags.save(filepath)
         except Exception as e:
             print(f"Couldn't add metadata to {filepath}: {e}")
 
     def cleanup(self):
         """Remove temporary files"""
-        if self.audio_file and os.path.exists(self.audio_file):
-            os.remove(self.audio_file)
+        # The audio file lives in download_dir, so this removes it along with any
+        # .part/.ytdl leftovers of an interrupted download
+        if self.download_dir:
+            shutil.rmtree(self.download_dir, ignore_errors=True)
+            self.download_dir = None
 
-# The AudioPreview class is largely removed, its core functionality for creating temporary
-# preview files is moved into AudioPlayerControl, and its playback logic directly uses pygame.mixer.
-# This simplifies the architecture by removing a redundant abstraction layer for previews.
+# The AudioPreview class is largely removed. Previews play straight from the downloaded audio
+# in an ffplay subprocess driven by AudioPlayerControl, so nothing is encoded up front and no
+# audio library has to be initialised at startup.
 
 class AudioPlayerControl(ttk.Frame):
     def __init__(self, parent, root_gui_ref): # Renamed `preview_manager` to `root_gui_ref`
         super().__init__(parent)
-        pygame.mixer.init() # Initialize mixer once here
         self.root_gui_ref = root_gui_ref # Reference to the main GUI instance
         self.is_playing = False
         self.current_position = 0
         self.duration = 0
-        self.preview_file = None # To store the path of the current temporary preview file
-        self.playback_start_offset = 0 # Added for accurate seek/playback position
+        self.track_start = None # Start of the loaded track in the downloaded audio, in seconds (None: nothing loaded)
+        self.player_process = None # ffplay process while playing
+        self.playback_start_offset = 0 # Position the running ffplay started from
+        self.playback_started_at = 0 # time.monotonic() when the running ffplay started
         self.setup_ui()
-        self.update_interval = 250  # ms
+        self.update_interval = 500  # ms; position comes from the clock, so this only sets how often the slider moves
         self.after_id = None
+        self.restart_after_id = None
 
     def setup_ui(self):
         # Playback controls
@@ -352,93 +720,90 @@ class AudioPlayerControl(ttk.Frame):
         self.volume_icon = ttk.Label(self, text="🔊")
         self.volume_icon.grid(row=0, column=5, padx=5)
         
-        # Set initial volume
-        pygame.mixer.music.set_volume(self.volume_var.get() / 100)
-        
         # Configure grid weights
         self.columnconfigure(3, weight=1)
 
     def load_track_for_playback(self, track: Track):
         """
-        Loads a portion of the selected track for immediate playback control.
-        Creates a temporary preview file for this purpose.
+        Loads the selected track for immediate playback control.
+        ffplay seeks into the downloaded audio itself, so there is nothing to prepare.
         """
-        self.stop_playback() # Stop and clear any existing preview
+        self.stop_playback() # Stop any existing preview
 
         if not self.root_gui_ref.splitter.audio_file:
             self.set_duration(0)
             self.root_gui_ref.status_var.set("Please download audio first to preview tracks.")
             return
 
-        # Start a new thread for ffmpeg processing to avoid blocking the GUI
-        threading.Thread(target=self._load_track_in_thread, args=(track,), daemon=True).start()
-
-    def _load_track_in_thread(self, track: Track):
         try:
-            start_sec = self.root_gui_ref.splitter.parse_timestamp(track.start_time)
-            
             # Determine the effective end time for the preview
-            end_sec_for_preview = None
             if track.end_time:
-                end_sec_for_preview = self.root_gui_ref.splitter.parse_timestamp(track.end_time)
-            else:
-                full_audio = MP3(self.root_gui_ref.splitter.audio_file)
-                end_sec_for_preview = int(full_audio.info.length)
-
-            if end_sec_for_preview is not None:
-                preview_length_sec = end_sec_for_preview - start_sec
+                end_sec_for_preview = track.end_sec
             else:
-                full_audio = MP3(self.root_gui_ref.splitter.audio_file)
-                preview_length_sec = int(full_audio.info.length) - start_sec
-
-            if preview_length_sec <= 0:
-                self.root_gui_ref.root.after(0, lambda: self.root_gui_ref.status_var.set("Track has zero or negative duration. Cannot preview."))
-                return
+                # The download isn't necessarily MP3, so don't rely on mutagen's MP3 reader here
+                end_sec_for_preview = self.root_gui_ref.splitter.get_audio_duration()
+            preview_length_sec = end_sec_for_preview - track.start_sec
+        except Exception as e:
+            messagebox.showerror("Error", f"Error loading track for playback: {e}")
+            self.reset()
+            self.root_gui_ref.status_var.set("Error loading track.")
+            return
 
-            self.root_gui_ref.root.after(0, lambda: self.root_gui_ref.status_var.set(f"Creating preview for: {track.title}... (this may take a moment)"))
-            
-            # Create a temporary preview file
-            self.preview_file = tempfile.mktemp(suffix='.mp3')
-            cmd = [
-                'ffmpeg', '-i', self.root_gui_ref.splitter.audio_file,
-                '-ss', str(start_sec),
-                '-t', str(preview_length_sec),
-                '-acodec', 'libmp3lame', # Use libmp3lame for better quality/compatibility
-                '-q:a', '4', # Variable bitrate, good quality
-                '-y', self.preview_file
-            ]
-            # Removed creationflags=subprocess.CREATE_NO_WINDOW
-            subprocess.run(cmd, check=True, capture_output=True) 
-            
-            # Load and prepare playback in the main thread
-            self.root_gui_ref.root.after(0, lambda: self._finalize_playback_load(preview_length_sec, track.title))
+        if preview_length_sec <= 0:
+            self.root_gui_ref.status_var.set("Track has zero or negative duration. Cannot preview.")
+            return
 
-        except subprocess.CalledProcessError as e:
-            self.root_gui_ref.root.after(0, lambda: messagebox.showerror("Error", f"Failed to create preview: {e.stderr.decode()}"))
-            self.root_gui_ref.root.after(0, self.reset)
-            self.root_gui_ref.root.after(0, lambda: self.root_gui_ref.status_var.set("Error creating preview."))
-        except Exception as e:
-            self.root_gui_ref.root.after(0, lambda: messagebox.showerror("Error", f"Error loading track for playback: {e}"))
-            self.root_gui_ref.root.after(0, self.reset)
-            self.root_gui_ref.root.after(0, lambda: self.root_gui_ref.status_var.set("Error loading track."))
+        self.track_start = track.start_sec
+        self.set_duration(preview_length_sec) # Set duration for slider
+        self.play_btn.config(text="▶") # Set to play symbol
+        self.root_gui_ref.status_var.set(f"Loaded for playback: {track.title}")
+
+    def _start_player(self):
+        """Spawn ffplay for the loaded track from current_position to the end of the track"""
+        cmd = [
+            'ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet',
+            '-ss', f"{self.track_start + self.current_position:.2f}",
+            '-t', f"{self.duration - self.current_position:.2f}",
+            '-volume', str(int(self.volume_var.get())), # ffplay takes 0-100, same as the slider
+            self.root_gui_ref.splitter.audio_file
+        ]
+        self.player_process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.playback_start_offset = self.current_position # Store the offset
+        self.playback_started_at = time.monotonic()
+
+    def _playing_position(self) -> float:
+        """Position in the track: where the running ffplay started plus how long it has been running"""
+        return self.playback_start_offset + (time.monotonic() - self.playback_started_at)
+
+    def _stop_player(self):
+        """Terminate the running ffplay, if any"""
+        if self.restart_after_id:
+            self.after_cancel(self.restart_after_id)
+            self.restart_after_id = None
+        if self.player_process:
+            self.player_process.terminate()
+            try:
+                self.player_process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.player_process.kill()
+            self.player_process = None
+
+    def _restart_player(self):
+        """Respawn ffplay at the current position, e.g. after a seek or volume change"""
+        self.restart_after_id = None
+        if self.is_playing:
+            self.current_position = min(self._playing_position(), self.duration)
+            self._stop_player()
+            self._start_player()
 
-    def _finalize_playback_load(self, preview_length_sec: int, track_title: str):
-        """Called in the main thread after ffmpeg completes in the background."""
-        try:
-            pygame.mixer.music.load(self.preview_file)
-            self.set_duration(preview_length_sec) # Set duration for slider
-            self.play_btn.config(text="▶") # Set to play symbol
-            self.current_position = 0
-            self.seek_var.set(0)
-            self.update_time_display()
-            self.root_gui_ref.status_var.set(f"Loaded for playback: {track_title}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error finalizing playback: {e}")
-            self.reset()
-            self.root_gui_ref.status_var.set("Error finalizing playback.")
+    def _schedule_restart(self):
+        # Sliders fire for every pixel dragged; only respawn ffplay once the drag settles
+        if self.restart_after_id:
+            self.after_cancel(self.restart_after_id)
+        self.restart_after_id = self.after(200, self._restart_player)
 
     def toggle_playback(self):
-        if self.preview_file is None:
+        if self.track_start is None:
             self.root_gui_ref.status_var.set("No track loaded. Select a track to play.")
             return
 
@@ -448,13 +813,13 @@ class AudioPlayerControl(ttk.Frame):
             self.start_playback()
 
     def start_playback(self):
-        if self.preview_file is None: return # Should not happen if called after load_track_for_playback
+        if self.track_start is None: return # Should not happen if called after load_track_for_playback
 
-        if not pygame.mixer.music.get_busy() or pygame.mixer.music.get_pos() == -1: # -1 means stopped or not playing
-            pygame.mixer.music.play(start=self.current_position) # Start from current position
-            self.playback_start_offset = self.current_position # Store the offset
-        else:
-            pygame.mixer.music.unpause()
+        try:
+            self._start_player() # Resumes from current_position after a pause
+        except FileNotFoundError:
+            messagebox.showerror("Error", "ffplay was not found. It comes with ffmpeg; make sure it is on your PATH.")
+            return
         
         self.is_playing = True
         self.play_btn.config(text="❚❚")  # Pause symbol
@@ -462,18 +827,21 @@ class AudioPlayerControl(ttk.Frame):
         self.root_gui_ref.status_var.set("Playing...")
 
     def pause_playback(self):
-        if self.preview_file is None: return
-        pygame.mixer.music.pause()
+        if self.track_start is None: return
+        # ffplay can't be paused without its window, so remember where we are and stop it
+        self.current_position = self._playing_position()
+        self._stop_player()
         self.is_playing = False
         self.play_btn.config(text="▶")
         if self.after_id:
             self.after_cancel(self.after_id)
             self.after_id = None
+        self.update_time_display()
         self.root_gui_ref.status_var.set("Paused.")
 
 
     def stop_playback(self):
-        pygame.mixer.music.stop()
+        self._stop_player()
         self.is_playing = False
         self.play_btn.config(text="▶")
         self.current_position = 0
@@ -483,37 +851,30 @@ class AudioPlayerControl(ttk.Frame):
         if self.after_id:
             self.after_cancel(self.after_id)
             self.after_id = None
-        
-        # Clean up the temporary preview file
-        if self.preview_file and os.path.exists(self.preview_file):
-            try:
-                os.remove(self.preview_file)
-            except OSError:
-                pass # File might still be in use by pygame for a moment, best effort
-        self.preview_file = None
+        self.track_start = None # Unload, as the next preview may be from a different download
         self.root_gui_ref.status_var.set("Playback stopped.")
 
 
     def on_seek(self, value):
-        if not self.preview_file: # Use self.preview_file to check if a track is loaded
+        if self.track_start is None: # Use self.track_start to check if a track is loaded
             return
             
         seek_pos_percent = float(value)
         if self.duration > 0:
-            # pygame.mixer.music.set_pos uses seconds relative to the loaded track
             new_pos_seconds = (seek_pos_percent / 100) * self.duration
-            pygame.mixer.music.set_pos(new_pos_seconds)
             self.current_position = new_pos_seconds # Update our internal position tracker
             self.playback_start_offset = new_pos_seconds # Set offset to the new seek position
+            self.playback_started_at = time.monotonic()
             self.update_time_display()
 
             if self.is_playing: # If playing, restart playback from new position
-                pygame.mixer.music.play(start=new_pos_seconds) # Restart from new position
-                self.update_playback_position() # Restart the update loop
+                self._schedule_restart()
 
     def on_volume_change(self, value):
         volume = float(value) / 100
-        pygame.mixer.music.set_volume(volume)
+        # ffplay only takes the volume at startup, so a playing preview is restarted where it is
+        if self.is_playing:
+            self._schedule_restart()
         # Update volume icon based on level
         if volume == 0:
             self.volume_icon.config(text="🔇")
@@ -523,30 +884,21 @@ class AudioPlayerControl(ttk.Frame):
             self.volume_icon.config(text="🔊")
 
     def update_playback_position(self):
-        # pygame.mixer.music.get_pos() returns milliseconds since playback started for the *current* play() call
-        # It resets when play() is called, so we need to track overall position.
+        # Position is the offset ffplay started from plus the wall time it has been running
         if self.is_playing:
-            mixer_pos_ms = pygame.mixer.music.get_pos()
-            if mixer_pos_ms != -1: # if music is actively playing
-                current_mixer_time_s = (mixer_pos_ms / 1000.0) 
-                
-                # Calculate actual current position by adding the playback_start_offset
-                self.current_position = self.playback_start_offset + current_mixer_time_s
-                
-                # Check if playback has finished for the loaded preview file
-                if self.current_position >= self.duration - 0.1: # Allow for slight floating point inaccuracies
-                    self.stop_playback()
-                    return # Exit recursion
-
-                # Update seek slider
-                if self.duration > 0:
-                    self.seek_var.set((self.current_position / self.duration) * 100)
-                
-                self.update_time_display()
-            else:
-                # If get_pos() returns -1, it might mean playback finished or stopped unexpectedly
+            self.current_position = self._playing_position()
+            
+            # Check if playback has finished for the loaded track (ffplay exits on its own with -autoexit)
+            finished = self.player_process and self.player_process.poll() is not None and not self.restart_after_id
+            if finished or self.current_position >= self.duration - 0.1: # Allow for slight floating point inaccuracies
                 self.stop_playback()
-                return
+                return # Exit recursion
+
+            # Update seek slider
+            if self.duration > 0:
+                self.seek_var.set((self.current_position / self.duration) * 100)
+            
+            self.update_time_display()
 
             self.after_id = self.after(self.update_interval, self.update_playback_position)
         # else: if not is_playing, the loop is already cancelled by pause/stop_playback
@@ -592,9 +944,20 @@ class ThumbnailCropper(tk.Toplevel):
         self.cropped_image_data = None  # To store the result of the crop
         self.cropped_original_coords = None # To store the coords of the result in original image system
         
-        self.original_image = Image.open(BytesIO(image_data))
+        self.original_image = _decode_image(image_data) # Only read from; display copies are made below
         self.display_image = None # Will store the scaled image for display
         self.photo_image = None # Tkinter PhotoImage reference
+        self.image_id = None # Canvas item showing photo_image, created once and then moved/updated
+        self.display_size = None # (width, height) of display_image, to skip resizes that change nothing
+        self.resize_after_id = None # Pending redraw after a burst of <Configure> events
+
+        # Display copies are scaled from a version no bigger than twice the screen rather than
+        # from the full original; crops are still cut from original_image.
+        max_side = 2 * max(self.winfo_screenwidth(), self.winfo_screenheight())
+        self.display_source = self.original_image
+        if max(self.original_image.size) > max_side:
+            self.display_source = self.original_image.copy()
+            self.display_source.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
 
         # Canvas and image scaling properties
         self.canvas_width = 600
@@ -612,11 +975,16 @@ class ThumbnailCropper(tk.Toplevel):
         self.rect_id = None
         self.handle_ids = []
         self.HANDLE_SIZE = 8 # Size of square handles
+        self.crop_bounds = (0, 0, 0, 0) # Ordered (x1, y1, x2, y2) of the box as last drawn, for hit tests
+        self.current_cursor = None # Last cursor set on the canvas, to skip redundant Tk calls
 
         # State variables for dragging/resizing
         self.dragging_mode = None # 'move' or 'resize_corner_NE', 'resize_corner_NW', etc.
         self.drag_start_x = None
         self.drag_start_y = None
+        self.pending_drag_event = None # Latest <B1-Motion> not yet applied
+        self.drag_after_id = None # after_idle callback that will apply it
+        self.last_drag_position = None # Pointer position the crop box was last updated for
         
         # Store current crop coordinates for calculations during drag
         self.initial_drag_crop_x1 = 0
@@ -637,7 +1005,8 @@ class ThumbnailCropper(tk.Toplevel):
         button_frame = ttk.Frame(self)
         button_frame.pack(pady=10)
         
-        ttk.Button(button_frame, text="Crop", command=self.perform_crop).pack(side=tk.LEFT, padx=5)
+        self.crop_button = ttk.Button(button_frame, text="Crop", command=self.perform_crop)
+        self.crop_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.cancel_crop).pack(side=tk.LEFT, padx=5)
 
         # Initial drawing after canvas is packed and has dimensions
@@ -653,13 +1022,22 @@ class ThumbnailCropper(tk.Toplevel):
         # Update canvas dimensions when window is resized
         self.canvas_width = event.width
         self.canvas_height = event.height
+        # Dragging the window edge fires <Configure> for every pixel; only redraw once it settles
+        if self.resize_after_id:
+            self.after_cancel(self.resize_after_id)
+        self.resize_after_id = self.after(50, self._apply_resize)
+
+    def _apply_resize(self):
+        self.resize_after_id = None
+        # Pin an existing crop box to the original image while the old scale/offset still apply,
+        # so it keeps its place on the picture when the image is rescaled
+        if self.rect_id:
+            self.remember_crop_in_original()
         self.update_canvas_image()
         # Ensure the crop rectangle is redrawn to fit new scaling/offsets
-        self.draw_initial_crop_rectangle(use_current_if_exists=True) # Use existing if already set
+        self.draw_initial_crop_rectangle()
 
     def update_canvas_image(self):
-        self.canvas.delete("all")
-        
         img_width, img_height = self.original_image.size
         
         # Calculate scale to fit image within canvas while maintaining aspect ratio
@@ -667,8 +1045,11 @@ class ThumbnailCropper(tk.Toplevel):
         new_width = int(img_width * scale)
         new_height = int(img_height * scale)
         
-        self.display_image = self.original_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        self.photo_image = ImageTk.PhotoImage(self.display_image)
+        # The window often changes only along the letterboxed side; then the scaled image is still right
+        if (new_width, new_height) != self.display_size:
+            self.display_image = self.display_source.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            self.photo_image = ImageTk.PhotoImage(self.display_image)
+            self.display_size = (new_width, new_height)
         
         # Store scale factor for converting canvas coordinates to original image coordinates
         self.scale_factor_x = img_width / new_width
@@ -678,40 +1059,40 @@ class ThumbnailCropper(tk.Toplevel):
         self.image_offset_x = (self.canvas_width - new_width) / 2
         self.image_offset_y = (self.canvas_height - new_height) / 2
         
-        self.canvas.create_image(self.image_offset_x, self.image_offset_y, image=self.photo_image, anchor=tk.NW)
+        # Reuse the one image item instead of deleting and recreating everything on the canvas
+        if self.image_id is None:
+            self.image_id = self.canvas.create_image(self.image_offset_x, self.image_offset_y, image=self.photo_image, anchor=tk.NW)
+        else:
+            self.canvas.itemconfigure(self.image_id, image=self.photo_image)
+            self.canvas.coords(self.image_id, self.image_offset_x, self.image_offset_y)
         
         # This is important: after updating the image, we must recalculate
         # the initial crop rectangle based on the potentially new scale and offset.
         # This will be handled by on_canvas_resize calling draw_initial_crop_rectangle.
 
 
-    def draw_initial_crop_rectangle(self, use_current_if_exists=False):
+    def remember_crop_in_original(self):
+        """
+        Stores the current crop box in original image coordinates as initial_crop_coords_original,
+        so the next draw_initial_crop_rectangle puts it back on the same part of the image.
+        Must run before the scale factors and offsets change.
+        """
+        # Current crop box on canvas, as last drawn (ordered), stored as the "initial" for the next redraw
+        self.initial_crop_coords_original = self.canvas_to_original(*self.crop_bounds)
+
+    def canvas_to_original(self, x1, y1, x2, y2) -> Tuple[int, int, int, int]:
+        """Convert a box on the canvas to original image coordinates with the current offset and scale"""
+        offset_x, offset_y = self.image_offset_x, self.image_offset_y
+        scale_x, scale_y = self.scale_factor_x, self.scale_factor_y
+        return (int((x1 - offset_x) * scale_x), int((y1 - offset_y) * scale_y),
+                int((x2 - offset_x) * scale_x), int((y2 - offset_y) * scale_y))
+
+    def draw_initial_crop_rectangle(self):
         """
         Draws the initial crop rectangle.
         If initial_crop_coords_original is set, it uses that.
         Otherwise, it calculates the largest possible square centered on the displayed image.
-        
-        :param use_current_if_exists: If True, and crop_x1/y1/x2/y2 are already set (e.g., from a drag),
-                                      it converts them to original, then back to new canvas coords,
-                                      effectively preserving the relative position/size.
         """
-        
-        # First, convert current canvas crop coords to original image coords if needed
-        # This ensures that if the window was resized, the crop box scales appropriately.
-        if use_current_if_exists and self.rect_id:
-            # Get current crop box coords on canvas
-            current_canvas_x1, current_canvas_y1, current_canvas_x2, current_canvas_y2 = self.canvas.coords(self.rect_id)
-
-            # Convert to original image coordinates
-            crop_original_x1 = int((current_canvas_x1 - self.image_offset_x) * self.scale_factor_x)
-            crop_original_y1 = int((current_canvas_y1 - self.image_offset_y) * self.scale_factor_y)
-            crop_original_x2 = int((current_canvas_x2 - self.image_offset_x) * self.scale_factor_x)
-            crop_original_y2 = int((current_canvas_y2 - self.image_offset_y) * self.scale_factor_y)
-            
-            # Store these as the "initial" for this redraw
-            self.initial_crop_coords_original = (crop_original_x1, crop_original_y1, crop_original_x2, crop_original_y2)
-
-
         if self.initial_crop_coords_original:
             # If initial crop coordinates were provided (from previous session or last crop)
             # Convert them from original image coordinates to current canvas coordinates
@@ -755,76 +1136,98 @@ class ThumbnailCropper(tk.Toplevel):
 
 
     def draw_crop_rectangle(self):
-        # Clear previous rectangle and handles
-        if self.rect_id:
-            self.canvas.delete(self.rect_id)
-        for handle_id in self.handle_ids:
-            self.canvas.delete(handle_id)
-        self.handle_ids.clear()
-
         # Ensure x1<x2, y1<y2 for drawing (important for drag logic too)
         # These are the actual drawing coordinates for the rectangle
         draw_x1, draw_y1 = min(self.crop_x1, self.crop_x2), min(self.crop_y1, self.crop_y2)
         draw_x2, draw_y2 = max(self.crop_x1, self.crop_x2), max(self.crop_y1, self.crop_y2)
-
-        self.rect_id = self.canvas.create_rectangle(
-            draw_x1, draw_y1, draw_x2, draw_y2, outline="red", width=2, tags="crop_box"
-        )
-        
-        # Draw handles
-        self.handle_ids.append(self.canvas.create_rectangle(draw_x1 - self.HANDLE_SIZE/2, draw_y1 - self.HANDLE_SIZE/2, draw_x1 + self.HANDLE_SIZE/2, draw_y1 + self.HANDLE_SIZE/2, fill="blue", tags="handle_NW"))
-        self.handle_ids.append(self.canvas.create_rectangle(draw_x2 - self.HANDLE_SIZE/2, draw_y1 - self.HANDLE_SIZE/2, draw_x2 + self.HANDLE_SIZE/2, draw_y1 + self.HANDLE_SIZE/2, fill="blue", tags="handle_NE"))
-        self.handle_ids.append(self.canvas.create_rectangle(draw_x1 - self.HANDLE_SIZE/2, draw_y2 - self.HANDLE_SIZE/2, draw_x1 + self.HANDLE_SIZE/2, draw_y2 + self.HANDLE_SIZE/2, fill="blue", tags="handle_SW"))
-        self.handle_ids.append(self.canvas.create_rectangle(draw_x2 - self.HANDLE_SIZE/2, draw_y2 - self.HANDLE_SIZE/2, draw_x2 + self.HANDLE_SIZE/2, draw_y2 + self.HANDLE_SIZE/2, fill="blue", tags="handle_SE"))
+        self.crop_bounds = (draw_x1, draw_y1, draw_x2, draw_y2)
+
+        # Handle squares centred on the NW, NE, SW and SE corners
+        half = self.HANDLE_SIZE / 2
+        handle_boxes = [
+            (corner_x - half, corner_y - half, corner_x + half, corner_y + half)
+            for corner_x, corner_y in ((draw_x1, draw_y1), (draw_x2, draw_y1), (draw_x1, draw_y2), (draw_x2, draw_y2))
+        ]
+
+        # Create the items on the first draw; after that just move them, which is far cheaper than delete+create
+        if self.rect_id is None:
+            self.rect_id = self.canvas.create_rectangle(
+                draw_x1, draw_y1, draw_x2, draw_y2, outline="red", width=2, tags="crop_box"
+            )
+            self.handle_ids = [
+                self.canvas.create_rectangle(*box, fill="blue", tags=f"handle_{corner}")
+                for box, corner in zip(handle_boxes, ('NW', 'NE', 'SW', 'SE'))
+            ]
+        else:
+            self.canvas.coords(self.rect_id, draw_x1, draw_y1, draw_x2, draw_y2)
+            for handle_id, box in zip(self.handle_ids, handle_boxes):
+                self.canvas.coords(handle_id, *box)
 
     def get_handle_type(self, x, y):
-        # Use the potentially unordered self.crop_x/y for getting the actual current bounds
-        current_x1, current_y1 = min(self.crop_x1, self.crop_x2), min(self.crop_y1, self.crop_y2)
-        current_x2, current_y2 = max(self.crop_x1, self.crop_x2), max(self.crop_y1, self.crop_y2)
+        # The ordered bounds are kept up to date by draw_crop_rectangle
+        current_x1, current_y1, current_x2, current_y2 = self.crop_bounds
 
         handle_tolerance = self.HANDLE_SIZE 
         
-        if (current_x1 - handle_tolerance <= x <= current_x1 + handle_tolerance) and \
-           (current_y1 - handle_tolerance <= y <= current_y1 + handle_tolerance):
-            return 'resize_corner_NW'
-        elif (current_x2 - handle_tolerance <= x <= current_x2 + handle_tolerance) and \
-             (current_y1 - handle_tolerance <= y <= current_y1 + handle_tolerance):
-            return 'resize_corner_NE'
-        elif (current_x1 - handle_tolerance <= x <= current_x1 + handle_tolerance) and \
-             (current_y2 - handle_tolerance <= y <= current_y2 + handle_tolerance):
-            return 'resize_corner_SW'
-        elif (current_x2 - handle_tolerance <= x <= current_x2 + handle_tolerance) and \
-             (current_y2 - handle_tolerance <= y <= current_y2 + handle_tolerance):
-            return 'resize_corner_SE'
-        elif (current_x1 <= x <= current_x2) and (current_y1 <= y <= current_y2):
+        # Corners in priority order, then the inside of the box
+        for corner_x, corner_y, mode in (
+            (current_x1, current_y1, 'resize_corner_NW'),
+            (current_x2, current_y1, 'resize_corner_NE'),
+            (current_x1, current_y2, 'resize_corner_SW'),
+            (current_x2, current_y2, 'resize_corner_SE'),
+        ):
+            if abs(x - corner_x) <= handle_tolerance and abs(y - corner_y) <= handle_tolerance:
+                return mode
+        if (current_x1 <= x <= current_x2) and (current_y1 <= y <= current_y2):
             return 'move' # Inside the crop box
         return None
 
+    def set_cursor(self, cursor):
+        # <Motion> fires for every pixel; only talk to Tk when the cursor actually changes
+        if cursor != self.current_cursor:
+            self.canvas.config(cursor=cursor)
+            self.current_cursor = cursor
+
     def on_mouse_move(self, event):
         mode = self.get_handle_type(event.x, event.y)
         if mode == 'move':
-            self.canvas.config(cursor="fleur")
-        elif mode and 'resize' in mode:
+            self.set_cursor("fleur")
+        elif mode in ('resize_corner_NW', 'resize_corner_SE'):
             # Change cursor based on corner for diagonal resize
-            if mode in ['resize_corner_NW', 'resize_corner_SE']:
-                self.canvas.config(cursor="sizing NW_SE")
-            elif mode in ['resize_corner_NE', 'resize_corner_SW']:
-                self.canvas.config(cursor="sizing NE_SW")
+            self.set_cursor("sizing NW_SE")
+        elif mode in ('resize_corner_NE', 'resize_corner_SW'):
+            self.set_cursor("sizing NE_SW")
         else:
-            self.canvas.config(cursor="arrow") # Default cursor
+            self.set_cursor("arrow") # Default cursor
 
     def on_button_press(self, event):
         self.drag_start_x = event.x
         self.drag_start_y = event.y
         self.dragging_mode = self.get_handle_type(event.x, event.y)
+        self.last_drag_position = (event.x, event.y)
 
-        # Store current crop coordinates for calculations
-        self.initial_drag_crop_x1 = self.crop_x1
-        self.initial_drag_crop_y1 = self.crop_y1
-        self.initial_drag_crop_x2 = self.crop_x2
-        self.initial_drag_crop_y2 = self.crop_y2
+        # Store current crop coordinates for calculations, ordered once here rather than on every drag event
+        self.initial_drag_crop_x1, self.initial_drag_crop_x2 = sorted((self.crop_x1, self.crop_x2))
+        self.initial_drag_crop_y1, self.initial_drag_crop_y2 = sorted((self.crop_y1, self.crop_y2))
 
     def on_mouse_drag(self, event):
+        # Motion events arrive faster than the canvas repaints. Keep only the latest one and
+        # apply it once Tk is idle, so a burst of them costs a single update.
+        self.pending_drag_event = event
+        if self.drag_after_id is None:
+            self.drag_after_id = self.after_idle(self.flush_drag)
+
+    def flush_drag(self):
+        self.drag_after_id = None
+        event = self.pending_drag_event
+        self.pending_drag_event = None
+        if event is not None and self.dragging_mode: # Pressing outside the box drags nothing
+            # Tk repeats motion events at the same pixel; those would only redraw the same box
+            if (event.x, event.y) != self.last_drag_position:
+                self.last_drag_position = (event.x, event.y)
+                self.apply_drag(event)
+
+    def apply_drag(self, event):
         dx = event.x - self.drag_start_x
         dy = event.y - self.drag_start_y
 
@@ -834,24 +1237,21 @@ class ThumbnailCropper(tk.Toplevel):
         img_x2 = self.image_offset_x + self.display_image.width
         img_y2 = self.image_offset_y + self.display_image.height
 
-        # Ensure current crop coordinates from initial_drag are ordered for calculations
-        current_x1_ordered, current_y1_ordered = min(self.initial_drag_crop_x1, self.initial_drag_crop_x2), min(self.initial_drag_crop_y1, self.initial_drag_crop_y2)
-        current_x2_ordered, current_y2_ordered = max(self.initial_drag_crop_x1, self.initial_drag_crop_x2), max(self.initial_drag_crop_y1, self.initial_drag_crop_y2)
-        
-        current_width = current_x2_ordered - current_x1_ordered
-        current_height = current_y2_ordered - current_y1_ordered
+        # Crop coordinates at the start of the drag (already ordered by on_button_press)
+        current_x1_ordered, current_y1_ordered = self.initial_drag_crop_x1, self.initial_drag_crop_y1
+        current_x2_ordered, current_y2_ordered = self.initial_drag_crop_x2, self.initial_drag_crop_y2
         
         min_size = self.HANDLE_SIZE * 2 # Minimum side length for the crop box
 
         if self.dragging_mode == 'move':
-            new_x1 = self.initial_drag_crop_x1 + dx
-            new_y1 = self.initial_drag_crop_y1 + dy
-            new_x2 = self.initial_drag_crop_x2 + dx
-            new_y2 = self.initial_drag_crop_y2 + dy
+            new_x1 = current_x1_ordered + dx
+            new_y1 = current_y1_ordered + dy
+            new_x2 = current_x2_ordered + dx
+            new_y2 = current_y2_ordered + dy
 
             # Clamp movement to image boundaries
-            width = self.initial_drag_crop_x2 - self.initial_drag_crop_x1
-            height = self.initial_drag_crop_y2 - self.initial_drag_crop_y1
+            width = current_x2_ordered - current_x1_ordered
+            height = current_y2_ordered - current_y1_ordered
 
             if new_x1 < img_x1:
                 new_x1 = img_x1
@@ -873,160 +1273,43 @@ class ThumbnailCropper(tk.Toplevel):
         elif 'resize' in self.dragging_mode:
             # The goal is to maintain a square aspect ratio while resizing
             
-            # Calculate proposed new dimensions based on drag
-            if self.dragging_mode == 'resize_corner_NW':
-                proposed_x1 = event.x
-                proposed_y1 = event.y
-                
-                # Calculate new side based on distance from opposite corner (current_x2_ordered, current_y2_ordered)
-                candidate_width = current_x2_ordered - proposed_x1
-                candidate_height = current_y2_ordered - proposed_y1
-                
-                new_side = min(candidate_width, candidate_height)
-                new_side = max(min_size, new_side) # Ensure min size
-
-                # Calculate new (x1, y1) based on new_side and opposite corner
-                new_x1 = current_x2_ordered - new_side
-                new_y1 = current_y2_ordered - new_side
-
-                # Clamp proposed x1, y1 to image bounds
-                new_x1 = max(img_x1, new_x1)
-                new_y1 = max(img_y1, new_y1)
-
-                # Adjust new_side if clamping occurred, maintaining square aspect
-                if new_x1 == img_x1:
-                    new_side = current_x2_ordered - img_x1
-                if new_y1 == img_y1:
-                    new_side = current_y2_ordered - img_y1
-                new_side = min(new_side, current_x2_ordered - img_x1, current_y2_ordered - img_y1)
-                new_side = max(min_size, new_side)
-
-                self.crop_x1 = current_x2_ordered - new_side
-                self.crop_y1 = current_y2_ordered - new_side
-                self.crop_x2 = current_x2_ordered
-                self.crop_y2 = current_y2_ordered
-
-            elif self.dragging_mode == 'resize_corner_NE':
-                proposed_x2 = event.x
-                proposed_y1 = event.y
-
-                candidate_width = proposed_x2 - current_x1_ordered
-                candidate_height = current_y2_ordered - proposed_y1
-                
-                new_side = min(candidate_width, candidate_height)
-                new_side = max(min_size, new_side)
-
-                # Clamp proposed x2, y1 to image bounds
-                new_x2 = min(img_x2, proposed_x2)
-                new_y1 = max(img_y1, proposed_y1)
-
-                # Adjust new_side if clamping occurred
-                if new_x2 == img_x2:
-                    new_side = img_x2 - current_x1_ordered
-                if new_y1 == img_y1:
-                    new_side = current_y2_ordered - img_y1
-                new_side = min(new_side, img_x2 - current_x1_ordered, current_y2_ordered - img_y1)
-                new_side = max(min_size, new_side)
-
-                self.crop_x1 = current_x1_ordered
-                self.crop_y1 = current_y2_ordered - new_side
-                self.crop_x2 = current_x1_ordered + new_side
-                self.crop_y2 = current_y2_ordered
-
-            elif self.dragging_mode == 'resize_corner_SW':
-                proposed_x1 = event.x
-                proposed_y2 = event.y
-
-                candidate_width = current_x2_ordered - proposed_x1
-                candidate_height = proposed_y2 - current_y1_ordered
-
-                new_side = min(candidate_width, candidate_height)
-                new_side = max(min_size, new_side)
-
-                # Clamp proposed x1, y2 to image bounds
-                new_x1 = max(img_x1, proposed_x1)
-                new_y2 = min(img_y2, proposed_y2)
-
-                # Adjust new_side if clamping occurred
-                if new_x1 == img_x1:
-                    new_side = current_x2_ordered - img_x1
-                if new_y2 == img_y2:
-                    new_side = img_y2 - current_y1_ordered
-                new_side = min(new_side, current_x2_ordered - img_x1, img_y2 - current_y1_ordered)
-                new_side = max(min_size, new_side)
-
-                self.crop_x1 = current_x2_ordered - new_side
-                self.crop_y1 = current_y1_ordered
-                self.crop_x2 = current_x2_ordered
-                self.crop_y2 = current_y1_ordered + new_side
-
-            elif self.dragging_mode == 'resize_corner_SE':
-                proposed_x2 = event.x
-                proposed_y2 = event.y
-
-                candidate_width = proposed_x2 - current_x1_ordered
-                candidate_height = proposed_y2 - current_y1_ordered
-
-                new_side = min(candidate_width, candidate_height)
-                new_side = max(min_size, new_side)
-
-                # Clamp proposed x2, y2 to image bounds
-                new_x2 = min(img_x2, proposed_x2)
-                new_y2 = min(img_y2, proposed_y2)
-
-                # Adjust new_side if clamping occurred
-                if new_x2 == img_x2:
-                    new_side = img_x2 - current_x1_ordered
-                if new_y2 == img_y2:
-                    new_side = img_y2 - current_y1_ordered
-                new_side = min(new_side, img_x2 - current_x1_ordered, img_y2 - current_y1_ordered)
-                new_side = max(min_size, new_side)
-
-                self.crop_x1 = current_x1_ordered
-                self.crop_y1 = current_y1_ordered
-                self.crop_x2 = current_x1_ordered + new_side
-                self.crop_y2 = current_y1_ordered + new_side
-            
-            # After calculating the new_side and updating crop_x/y based on the new side,
-            # we need to ensure the entire box remains within the image.
-            # This handles cases where the calculated new_side might cause the box
-            # to exceed bounds if the initial corner was already near the edge.
-
-            # Ensure the top-left is not less than image bounds
-            self.crop_x1 = max(img_x1, self.crop_x1)
-            self.crop_y1 = max(img_y1, self.crop_y1)
-
-            # Ensure the bottom-right is not greater than image bounds
-            # If the right edge is out, pull it back and adjust left
-            if self.crop_x2 > img_x2:
-                self.crop_x2 = img_x2
-                self.crop_x1 = self.crop_x2 - new_side # Maintain size
-            # If the bottom edge is out, pull it back and adjust top
-            if self.crop_y2 > img_y2:
-                self.crop_y2 = img_y2
-                self.crop_y1 = self.crop_y2 - new_side # Maintain size
+            # The corner opposite the dragged handle stays put; sign_x/sign_y point from it towards the handle
+            sign_x = -1 if self.dragging_mode in ('resize_corner_NW', 'resize_corner_SW') else 1
+            sign_y = -1 if self.dragging_mode in ('resize_corner_NW', 'resize_corner_NE') else 1
+            anchor_x = current_x2_ordered if sign_x < 0 else current_x1_ordered
+            anchor_y = current_y2_ordered if sign_y < 0 else current_y1_ordered
+
+            new_side = _resize_square_side(anchor_x, anchor_y, sign_x, sign_y, event.x, event.y,
+                                           img_x1, img_y1, img_x2, img_y2, min_size)
+
+            corner_x = anchor_x + sign_x * new_side
+            corner_y = anchor_y + sign_y * new_side
+            new_x1, new_x2 = min(anchor_x, corner_x), max(anchor_x, corner_x)
+            new_y1, new_y2 = min(anchor_y, corner_y), max(anchor_y, corner_y)
             
-            # Re-clamp top-left after potential bottom-right adjustment
-            self.crop_x1 = max(img_x1, self.crop_x1)
-            self.crop_y1 = max(img_y1, self.crop_y1)
+            # new_side already fits the room to the edges, except when min_size overrode it near an edge.
+            # Then slide the box back inside the image (keeping it square), and clip only what still
+            # can't fit because the image itself is smaller than min_size.
+            shift_x = max(0, img_x1 - new_x1) - max(0, new_x2 - img_x2)
+            shift_y = max(0, img_y1 - new_y1) - max(0, new_y2 - img_y2)
+            self.crop_x1, self.crop_x2 = max(img_x1, new_x1 + shift_x), min(img_x2, new_x2 + shift_x)
+            self.crop_y1, self.crop_y2 = max(img_y1, new_y1 + shift_y), min(img_y2, new_y2 + shift_y)
             
             self.draw_crop_rectangle()
 
     def on_button_release(self, event):
+        # Apply the last movement before the drag state is cleared
+        if self.drag_after_id:
+            self.after_cancel(self.drag_after_id)
+            self.flush_drag()
         self.dragging_mode = None
         self.drag_start_x = None
         self.drag_start_y = None
-        self.canvas.config(cursor="arrow") # Reset cursor
+        self.set_cursor("arrow") # Reset cursor
 
     def perform_crop(self):
-        # Get the current coordinates of the rectangle object (these are already ordered by draw_crop_rectangle)
-        x1_canvas, y1_canvas, x2_canvas, y2_canvas = self.canvas.coords(self.rect_id)
-
-        # Adjust for image offset on canvas
-        crop_original_x1 = int((x1_canvas - self.image_offset_x) * self.scale_factor_x)
-        crop_original_y1 = int((y1_canvas - self.image_offset_y) * self.scale_factor_y)
-        crop_original_x2 = int((x2_canvas - self.image_offset_x) * self.scale_factor_x)
-        crop_original_y2 = int((y2_canvas - self.image_offset_y) * self.scale_factor_y)
+        # The crop box as last drawn (already ordered by draw_crop_rectangle), in original image coordinates
+        crop_original_x1, crop_original_y1, crop_original_x2, crop_original_y2 = self.canvas_to_original(*self.crop_bounds)
 
         # Ensure coordinates are within original image bounds (should already be due to clamping)
         crop_original_x1 = max(0, crop_original_x1)
@@ -1035,15 +1318,27 @@ class ThumbnailCropper(tk.Toplevel):
         crop_original_y2 = min(self.original_image.height, crop_original_y2)
 
         cropped_image = self.original_image.crop((crop_original_x1, crop_original_y1, crop_original_x2, crop_original_y2))
+        coords = (crop_original_x1, crop_original_y1, crop_original_x2, crop_original_y2)
         
-        # Convert to bytes
-        byte_arr = BytesIO()
-        cropped_image.save(byte_arr, format='JPEG') # Assuming JPEG for thumbnails
-        self.cropped_image_data = byte_arr.getvalue()
-        
-        # Store the original image coordinates of the *final* crop for next time
-        self.cropped_original_coords = (crop_original_x1, crop_original_y1, crop_original_x2, crop_original_y2)
+        # JPEG encoding takes long enough to freeze the dialog, so it runs in the background;
+        # the window closes once the bytes are ready
+        self.crop_button.state(['disabled'])
+        threading.Thread(target=self._encode_crop_in_thread, args=(cropped_image, coords), daemon=True).start()
 
+    def _encode_crop_in_thread(self, cropped_image, coords):
+        try:
+            data = _encode_cover(cropped_image, self.original_image)
+        except Exception as e:
+            print(f"Error encoding cropped thumbnail: {e}")
+            data = None
+        self.after(0, partial(self._finish_crop, data, coords))
+
+    def _finish_crop(self, data, coords):
+        if not self.winfo_exists(): # Cancelled or closed while encoding
+            return
+        self.cropped_image_data = data
+        # Store the original image coordinates of the *final* crop for next time
+        self.cropped_original_coords = coords if data is not None else None
         self.destroy()
 
     def cancel_crop(self):
@@ -1051,6 +1346,16 @@ class ThumbnailCropper(tk.Toplevel):
         self.cropped_original_coords = None # Indicate no crop was performed/saved
         self.destroy()
 
+    def destroy(self):
+        # A redraw still pending would fire on the destroyed canvas
+        if self.resize_after_id:
+            self.after_cancel(self.resize_after_id)
+            self.resize_after_id = None
+        if self.drag_after_id:
+            self.after_cancel(self.drag_after_id)
+            self.drag_after_id = None
+        super().destroy()
+
 class YouTubeAlbumSplitterGUI:
     def __init__(self, root):
         self.root = root
@@ -1061,14 +1366,23 @@ class YouTubeAlbumSplitterGUI:
         # self.preview = AudioPreview() # AudioPreview is no longer a separate instance here
         self.tracks = []
         
-        # Pygame mixer initialization is now handled by AudioPlayerControl internally
-        # pygame.mixer.init()
-        
         self.thumbnail_label = None
+        self.thumbnail_photo = None # PhotoImage behind thumbnail_label, repainted in place while size and mode fit
+        self.thumbnail_photo_format = None # (size, mode) thumbnail_photo was created for
         self.thumbnail_data = None # Store the initially fetched thumbnail data
         self.cropped_thumbnail_data = None # Store the final (potentially cropped) thumbnail data
         self.last_cropped_original_coords = None # Store the original image coordinates of the last crop
         
+        # Downloads and splits run on one long-lived worker thread, one job at a time
+        self.jobs = queue.Queue()
+        threading.Thread(target=self._run_jobs, daemon=True).start()
+        
+        # Status messages from the worker: only the latest one is kept, and at most one
+        # Tk callback is queued to show it (see post_status)
+        self.status_lock = threading.Lock()
+        self.pending_status = None
+        self.status_update_queued = False
+        
         self.setup_ui()
 
     def setup_ui(self):
@@ -1188,12 +1502,62 @@ class YouTubeAlbumSplitterGUI:
         # New: Bind track selection to the AudioPlayerControl
         self.tracks_tree.bind('<<TreeviewSelect>>', self.on_track_selection)
 
+    def _run_jobs(self):
+        """Worker loop: each job reports its own errors and UI state through root.after"""
+        while True:
+            job = self.jobs.get()
+            job()
+
+    def _ui_start(self):
+        """Busy state while a download or split runs, set from a single Tk callback"""
+        self.progress.start()
+        self.download_btn.config(state='disabled')
+        self.process_btn.config(state='disabled')
+
+    def post_status(self, status: str):
+        """Show a status message from a worker thread, coalesced to at most ~30 updates a second"""
+        # Download progress hooks fire for every received chunk; queueing a Tk callback for each
+        # one floods the event loop. Later messages just replace the pending one.
+        with self.status_lock:
+            self.pending_status = status
+            if self.status_update_queued:
+                return
+            self.status_update_queued = True
+        self.root.after(33, self._show_pending_status)
+
+    def _show_pending_status(self):
+        with self.status_lock:
+            status = self.pending_status
+            self.pending_status = None
+            self.status_update_queued = False
+        if status is not None: # None: _ui_done has already shown the final message
+            self.status_var.set(status)
+
+    def _ui_done(self, status: str, error: str = None, info: str = None, enable_process: bool = True):
+        """Leave the busy state and report the outcome, again from a single Tk callback"""
+        # A progress message still waiting to be shown must not overwrite the outcome
+        with self.status_lock:
+            self.pending_status = None
+        self.progress.stop()
+        self.download_btn.config(state='normal')
+        if enable_process:
+            self.process_btn.config(state='normal')
+        self.status_var.set(status)
+        # Message boxes come last: they block until dismissed, and only the Tk thread may open them
+        if error:
+            messagebox.showerror("Error", error)
+        if info:
+            messagebox.showinfo("Success", info)
+
     def download_and_analyse(self):
         url = self.url_var.get().strip()
         if not url:
             messagebox.showerror("Error", "Please enter a YouTube URL")
             return
         
+        # The player reads the downloaded file directly, and the download below replaces it
+        self.player_controls.stop_playback()
+
         # Clear previous thumbnail if any
         self.thumbnail_data = None
         self.cropped_thumbnail_data = None
@@ -1203,59 +1567,50 @@ class YouTubeAlbumSplitterGUI:
 
         def download_thread():
             try:
-                self.root.after(0, lambda: self.progress.start())
-                self.root.after(0, lambda: self.download_btn.config(state='disabled'))
+                self.root.after(0, self._ui_start)
                 
-                def update_status(status):
-                    self.root.after(0, lambda: self.status_var.set(status))
+                auto_tracks = []
                 
-                update_status("Downloading audio...")
-                self.splitter.download_audio(url, update_status)
+                def on_video_info(video_info):
+                    # Tracks and thumbnail only need the metadata, so show them while the audio
+                    # is still downloading and let the user review them in the meantime.
+                    auto_tracks.extend(self.splitter.extract_tracks(video_info))
+                    self.root.after(0, partial(self.load_tracks, auto_tracks))
+                    self.root.after(0, self.fetch_thumbnail) # Call to fetch thumbnail
                 
-                update_status("Analyzing description...")
-                description = self.splitter.video_info.get('description', '')
-                auto_tracks = self.splitter.extract_timestamps_from_description(description)
+                self.post_status("Fetching video info...")
+                self.splitter.download_audio(url, self.post_status, on_video_info)
                 
-                self.root.after(0, lambda: self.load_tracks(auto_tracks))
-                self.root.after(0, lambda: self.progress.stop())
-                self.root.after(0, lambda: self.download_btn.config(state='normal'))
-                self.root.after(0, lambda: self.process_btn.config(state='normal'))
-                update_status(f"Found {len(auto_tracks)} tracks")
-                self.root.after(0, self.fetch_thumbnail) # Call to fetch thumbnail
+                self.root.after(0, partial(self._ui_done, f"Found {len(auto_tracks)} tracks"))
 
             except Exception as e:
-                self.root.after(0, lambda: self.progress.stop())
-                self.root.after(0, lambda: self.download_btn.config(state='normal'))
-                self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-                self.root.after(0, lambda: self.status_var.set("Error"))
+                # Format now: e is unbound once the except block ends, before the callback runs
+                error = str(e)
+                self.root.after(0, partial(self._ui_done, "Error", error=error, enable_process=False))
         
-        threading.Thread(target=download_thread, daemon=True).start()
+        self.jobs.put(download_thread)
     
     def load_tracks(self, tracks):
         self.tracks = tracks
         self.refresh_tracks_view()
     
     def refresh_tracks_view(self):
-        # Clear existing items
-        for item in self.tracks_tree.get_children():
-            self.tracks_tree.delete(item)
-        
-        # Add tracks
-        for i, track in enumerate(self.tracks):
-            duration = ""
-            if track.end_time:
-                start_sec = self.splitter.parse_timestamp(track.start_time)
-                end_sec = self.splitter.parse_timestamp(track.end_time)
-                duration_sec = end_sec - start_sec
-                duration = self.splitter.seconds_to_timestamp(duration_sec)
-            
-            self.tracks_tree.insert('', 'end', values=(
-                track.title,
-                track.artist, # New: Display artist
-                track.start_time,
-                track.end_time or "End",
-                duration
-            ))
+        # Format every row before touching the widget, so the Tk calls below run back to back
+        rows = [(
+            track.title,
+            track.artist, # New: Display artist
+            track.start_time,
+            track.end_time or "End",
+            self.splitter.seconds_to_timestamp(track.end_sec - track.start_sec) if track.end_time else ""
+        ) for track in self.tracks]
+
+        # Clear existing items in a single call
+        self.tracks_tree.delete(*self.tracks_tree.get_children())
+        
+        # Add tracks. Each row's id is its index in self.tracks, so a selection maps
+        # straight back to its track without Treeview.index() counting siblings.
+        for index, values in enumerate(rows):
+            self.tracks_tree.insert('', 'end', iid=str(index), values=values)
     
     def add_track(self):
         # Pass the current album artist as initial_artist for new tracks
@@ -1268,7 +1623,7 @@ class YouTubeAlbumSplitterGUI:
                     self.splitter.parse_timestamp(end_time)
                 
                 self.tracks.append(Track(title, start_time, end_time, artist)) # New: Pass artist
-                self.tracks.sort(key=lambda t: self.splitter.parse_timestamp(t.start_time))
+                self.tracks.sort(key=lambda t: t.start_sec)
                 self.refresh_tracks_view()
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
@@ -1280,7 +1635,7 @@ class YouTubeAlbumSplitterGUI:
             return
         
         item = selection[0]
-        index = self.tracks_tree.index(item)
+        index = int(item)
         track = self.tracks[index]
         
         # Pass existing track's artist to the dialog
@@ -1297,7 +1652,7 @@ class YouTubeAlbumSplitterGUI:
                 track.end_time = end_time
                 track.artist = artist # New: Update artist
                 
-                self.tracks.sort(key=lambda t: self.splitter.parse_timestamp(t.start_time))
+                self.tracks.sort(key=lambda t: t.start_sec)
                 self.refresh_tracks_view()
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
@@ -1310,7 +1665,7 @@ class YouTubeAlbumSplitterGUI:
         
         if messagebox.askyesno("Confirm", "Delete selected track?"):
             item = selection[0]
-            index = self.tracks_tree.index(item)
+            index = int(item)
             del self.tracks[index]
             self.refresh_tracks_view()
     
@@ -1319,7 +1674,7 @@ class YouTubeAlbumSplitterGUI:
         selection = self.tracks_tree.selection()
         if selection:
             item = selection[0]
-            index = self.tracks_tree.index(item)
+            index = int(item)
             track = self.tracks[index]
             self.player_controls.load_track_for_playback(track)
             
@@ -1332,27 +1687,42 @@ class YouTubeAlbumSplitterGUI:
     #     pass # Removed/Replaced
     
     def fetch_thumbnail(self):
-        if not self.splitter.video_info:
+        video_info = self.splitter.video_info
+        if not video_info:
             return
 
-        try:
-            # Get the highest resolution thumbnail
-            thumbnail_url = self.splitter.video_info.get('thumbnail')
-            if not thumbnail_url:
-                return
+        # Get the highest resolution thumbnail
+        thumbnail_url = video_info.get('thumbnail')
+        if not thumbnail_url:
+            return
+
+        # Network and decoding happen in the background; the Tk thread only shows the result
+        threading.Thread(target=self._fetch_thumbnail_in_thread, args=(video_info, thumbnail_url), daemon=True).start()
 
+    def _fetch_thumbnail_in_thread(self, video_info, thumbnail_url):
+        try:
             # Download thumbnail
-            response = requests.get(thumbnail_url, stream=True)
+            # Through the app-wide session, so the connection to the image host is reused across videos
+            response = _http().get(thumbnail_url, timeout=10)
             response.raise_for_status()
-            self.thumbnail_data = response.content # Store the original downloaded thumbnail
-            self.cropped_thumbnail_data = self.thumbnail_data # Initially, cropped is same as original
-            
-            # Show thumbnail and ask if user wants to crop
-            self.show_thumbnail_with_crop_option()
-            
+            thumbnail_data = response.content
+            _decode_image(thumbnail_data) # Decode here as well; the dialogs then get it from the cache
+            self.root.after(0, partial(self._install_thumbnail, video_info, thumbnail_data))
         except Exception as e:
             print(f"Error loading thumbnail: {e}")
-            messagebox.showwarning("Thumbnail Error", f"Could not fetch thumbnail: {e}")
+            message = f"Could not fetch thumbnail: {e}"
+            self.root.after(0, partial(messagebox.showwarning, "Thumbnail Error", message))
+
+    def _install_thumbnail(self, video_info, thumbnail_data: bytes):
+        """Called in the main thread once the thumbnail has been fetched and decoded."""
+        if video_info is not self.splitter.video_info:
+            return # Another video was analysed in the meantime
+
+        self.thumbnail_data = thumbnail_data # Store the original downloaded thumbnail
+        self.cropped_thumbnail_data = self.thumbnail_data # Initially, cropped is same as original
+        
+        # Show thumbnail and ask if user wants to crop
+        self.show_thumbnail_with_crop_option()
     
     def show_thumbnail_with_crop_option(self):
         """Display thumbnail and let user choose to crop"""
@@ -1361,7 +1731,7 @@ class YouTubeAlbumSplitterGUI:
         crop_dialog.title("Thumbnail Options")
         
         # Display thumbnail
-        img = Image.open(BytesIO(self.thumbnail_data))
+        img = _decode_image(self.thumbnail_data).copy() # thumbnail() works in place
         img.thumbnail((200, 200)) # Smaller for this dialog
         photo = ImageTk.PhotoImage(img)
         
@@ -1420,8 +1790,8 @@ class YouTubeAlbumSplitterGUI:
     def use_thumbnail_as_is(self, dialog):
         dialog.destroy()
         
-        # Open the original thumbnail data
-        original_img = Image.open(BytesIO(self.thumbnail_data))
+        # Open the original thumbnail data (crop() below returns a new image, so no copy needed)
+        original_img = _decode_image(self.thumbnail_data)
         
         # Calculate the largest possible square that fits within the original image
         img_width, img_height = original_img.size
@@ -1436,9 +1806,7 @@ class YouTubeAlbumSplitterGUI:
         cropped_square_img = original_img.crop((left, top, right, bottom))
         
         # Convert the cropped square image to bytes
-        byte_arr = BytesIO()
-        cropped_square_img.save(byte_arr, format='JPEG') # Assuming JPEG for thumbnails
-        self.cropped_thumbnail_data = byte_arr.getvalue()
+        self.cropped_thumbnail_data = _encode_cover(cropped_square_img, original_img)
         
         # Store the original image coordinates of this new square crop
         self.last_cropped_original_coords = (left, top, right, bottom)
@@ -1448,10 +1816,18 @@ class YouTubeAlbumSplitterGUI:
         """Display the final (cropped or original) thumbnail on the main UI."""
         if self.cropped_thumbnail_data:
             try:
-                img = Image.open(BytesIO(self.cropped_thumbnail_data))
+                img = _decode_image(self.cropped_thumbnail_data).copy() # thumbnail() works in place
                 img.thumbnail((150, 150))  # Display size on main UI
                 
-                photo = ImageTk.PhotoImage(img)
+                # Covers are square, so nearly every one comes out 150x150: paste into the existing
+                # PhotoImage rather than allocating a new Tk image each time. paste() converts to the
+                # mode the photo was created with, so a grayscale (L) photo can't take a color cover.
+                photo = self.thumbnail_photo
+                if photo is not None and self.thumbnail_photo_format == (img.size, img.mode):
+                    photo.paste(img)
+                else:
+                    photo = self.thumbnail_photo = ImageTk.PhotoImage(img)
+                    self.thumbnail_photo_format = (img.size, img.mode)
                 
                 self.thumbnail_label.config(image=photo)
                 self.thumbnail_label.image = photo  # Keep reference
@@ -1482,38 +1858,27 @@ class YouTubeAlbumSplitterGUI:
         if not output_dir:
             messagebox.showerror("Error", "Please select an output directory.")
             return
-        
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
 
+        # The splitter creates output_dir itself on the worker thread; a slow network drive can't stall
+        # the window, and a failure is reported like any other split error
         def split_thread():
             try:
-                self.root.after(0, lambda: self.progress.start())
-                self.root.after(0, lambda: self.process_btn.config(state='disabled'))
-                self.root.after(0, lambda: self.download_btn.config(state='disabled'))
-                
-                def update_status(status):
-                    self.root.after(0, lambda: self.status_var.set(status))
+                self.root.after(0, self._ui_start)
                 
                 # Pass the cropped_thumbnail_data to the splitter
-                self.splitter.split_audio(self.tracks, output_dir, self.cropped_thumbnail_data, update_status)
+                self.splitter.split_audio(self.tracks, output_dir, self.cropped_thumbnail_data, self.post_status)
                 
-                self.root.after(0, lambda: self.progress.stop())
-                self.root.after(0, lambda: self.process_btn.config(state='normal'))
-                self.root.after(0, lambda: self.download_btn.config(state='normal'))
-                self.root.after(0, lambda: self.status_var.set(f"Successfully split {len(self.tracks)} tracks."))
-                messagebox.showinfo("Success", f"Successfully split {len(self.tracks)} tracks to {output_dir}")
+                count = len(self.tracks)
+                self.root.after(0, partial(self._ui_done, f"Successfully split {count} tracks.",
+                                           info=f"Successfully split {count} tracks to {output_dir}"))
 
             except Exception as e:
-                self.root.after(0, lambda: self.progress.stop())
-                self.root.after(0, lambda: self.process_btn.config(state='normal'))
-                self.root.after(0, lambda: self.download_btn.config(state='normal'))
-                messagebox.showerror("Error", f"Splitting failed: {e}")
-                self.root.after(0, lambda: self.status_var.set("Splitting failed"))
-            finally:
-                self.splitter.cleanup()
+                error = f"Splitting failed: {e}"
+                self.root.after(0, partial(self._ui_done, "Splitting failed", error=error))
+            # The downloaded audio is kept so tracks can be adjusted and split again;
+            # it is removed on exit or when another video is downloaded.
         
-        threading.Thread(target=split_thread, daemon=True).start()
+        self.jobs.put(split_thread)
 
     def change_crop_thumbnail(self):
         """Allows user to re-crop or re-select the thumbnail."""
@@ -1528,7 +1893,7 @@ class YouTubeAlbumSplitterGUI:
 
     def on_closing(self):
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
-            self.player_controls.stop_playback() # Ensure pygame mixer is stopped and temp files are cleaned
+            self.player_controls.stop_playback() # Ensure no ffplay keeps playing after the window is gone
             self.splitter.cleanup()
             self.root.destroy()
 